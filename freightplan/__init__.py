@@ -21,6 +21,10 @@ APP_NAME = 'Freighter Planner'
 # This will only ever change if Hello Games changes the freighter build area
 GRID_SIZE = 21
 
+# Milliseconds between coalesced updates for high-rate input such as mouse
+# movement; roughly one frame at 60Hz
+FRAME_INTERVAL = 16
+
 # from .cell import Cell
 # from .document import Document
 # from .floor import Floor, Sector
@@ -20,38 +20,45 @@ A cell is the atomic unit of a grid; that is to say, a grid is made up of
 cells. Each cell can display a Tile, which is an image representing a
 particular component that can be placed on the freighter at the grid level,
 e.g. corridors and rooms.
+
+Cells do not own any data themselves; they are transient views onto the grid
+storage of the Floor they belong to, created on demand by Floor.cellAt().
 """
 
-from PySide2.QtCore import QPoint, QRect
+from PySide2.QtCore import QPoint
 
 from freightplan.gui.tile import Tile
 
 class Cell():
   """A single grid cell. Can contain a Tile."""
 
-  def __init__(self, pos: QPoint, parent):
+  __slots__ = ('_parent', '_pos')
+
+  def __init__(self, pos: QPoint, parent: 'Floor'):
     """Constructor.
 
     Args:
       pos: The position of this cell on the grid as a QPoint.
-      parent: The grid that this cell belongs to.
+      parent: The Floor whose grid this cell belongs to.
     """
 
     self._parent = parent
     self._pos = pos
-    self._tile = None
 
 
-  def parent(self):
-    """Return the parent grid that this cell belongs to."""
+  def parent(self) -> 'Floor':
+    """Return the parent Floor that this cell belongs to."""
 
     return self._parent
 
 
   def pos(self) -> QPoint:
-    """Return the cell's grid position as a QPoint."""
+    """Return the cell's grid position as a QPoint.
+
+    The returned QPoint is the cell's own; callers must not modify it.
+    """
 
-    return QPoint(self._pos)
+    return self._pos
 
 
   def x(self) -> int:
@@ -69,25 +76,28 @@ class Cell():
   def tile(self) -> Tile:
     """Return this cell's Tile object."""
 
-    return self._tile
+    return self._parent.tileAt(self._pos)
 
 
   def setTile(self, tile: Tile):
-    """Set this cell's Tile."""
+    """Set this cell's Tile.
+
+    The type of tile is only checked when running without optimizations,
+    i.e. when __debug__ is true.
+    """
 
-    if isinstance(tile, Tile):
-      self._tile = tile
-    else:
+    if __debug__ and not isinstance(tile, Tile):
       raise TypeError('Must be a Tile object')
+    self._parent.setTileAt(self._pos, tile)
 
 
   def clearTile(self):
     """Removes the cell's current Tile."""
 
-    self._tile = None
+    self._parent.setTileAt(self._pos, None)
 
 
   def isEmpty(self) -> bool:
     """Return whether or not the cell is empty, i.e. has a Tile."""
 
-    return self._tile == None
\ No newline at end of file
+    return self.tile() is None
\ No newline at end of file
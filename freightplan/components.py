@@ -24,20 +24,20 @@ This module defines all components and can provide information about them to
 the other modules of freightplan.
 """
 
-from enum import Enum, unique
+from enum import IntEnum, unique
 
-from PySide2.QtGui import QIcon
+from PySide2.QtGui import QIcon, QPixmap
 
 import freightplan.gui.iconmanager as IconManager
 
 _componentNameMap = {}
-_componentIDMap = {}
 
 @unique
-class ComponentID(Enum):
+class ComponentID(IntEnum):
   """Enumeration of Component IDs.
 
   Each component is assigned a unique ID, which is mapped in this enumeration.
+  IDs are plain integers, so they can be used directly as indices.
   """
 
   RoomLarge        = 1
@@ -53,6 +53,8 @@ class ComponentID(Enum):
 class Component():
   """A freighter component."""
 
+  __slots__ = ('_cid', '_name', '_icon', '_pixmap')
+
   def __init__(self, cid: ComponentID, name: str):
     """Constructor. Creates a new component.
 
@@ -70,6 +72,8 @@ class Component():
       raise TypeError(f'cid argument must be a ComponentID, not {type(cid)}')
 
     self._name = name
+    self._icon = None
+    self._pixmap = None
 
 
   def cid(self) -> ComponentID:
@@ -85,19 +89,25 @@ class Component():
 
 
   def icon(self) -> QIcon:
-    """Return this component's icon."""
+    """Return this component's icon.
 
-    return IconManager.getIcon(self._cid.name)
+    The icon is looked up on first access and cached on the component.
+    """
 
+    if self._icon is None:
+      self._icon = IconManager.getIcon(self._cid.name)
+    return self._icon
 
-def _validID(cid: ComponentID) -> bool:
-  """Return whether the given cid is a valid ComponentID."""
 
-  if isinstance(cid, ComponentID):
-    return True
-  else:
-    raise TypeError(f'cid argument must be a ComponentID, not {type(cid)}')
-    return False
+  def pixmap(self) -> QPixmap:
+    """Return this component's pixmap, as placed on the Editor grid.
+
+    The pixmap is shared by every Tile of this component.
+    """
+
+    if self._pixmap is None:
+      self._pixmap = IconManager.getPixmap(self._cid.name)
+    return self._pixmap
 
 
 def _validName(name: str) -> bool:
@@ -110,12 +120,12 @@ def _validName(name: str) -> bool:
 
 
 def componentByID(cid: ComponentID) -> Component:
-  """Return the component specified by its ComponentID."""
+  """Return the component specified by its ComponentID.
 
-  if _validID(cid):
-    return _componentIDMap[cid]
-  else:
-    return None
+  Raises ValueError if cid is not a valid ComponentID.
+  """
+
+  return _componentByID[ComponentID(cid)]
 
 
 def componentByName(name: str) -> Component:
@@ -130,7 +140,7 @@ def componentByName(name: str) -> Component:
 def componentList() -> list:
   """Return a list of all components."""
 
-  return [_componentIDMap[x] for x in ComponentID]
+  return [_componentByID[x] for x in ComponentID]
 
 
 # TEMP: Kludge until QTranslate is implemented
@@ -145,8 +155,12 @@ _nameMap = {
   'Stairs': 'Stairs',
 }
 
+# Component IDs are small, dense integers, so components are looked up by
+# indexing a list with the ID rather than hashing it.
+_componentByID = [None] * (max(ComponentID) + 1)
+
 for cid in ComponentID:
   name = _nameMap[cid.name]
   c = Component(cid, name)
-  _componentIDMap[cid] = c
+  _componentByID[cid] = c
   _componentNameMap[name] = c
\ No newline at end of file
@@ -26,6 +26,9 @@ from PySide2.QtCore import QDateTime, QFile, QFileInfo
 class Document():
   """Document class. Encapsulate a writable file."""
 
+  __slots__ = ('_fileinfo', '_baseName', '_fileName', '_absoluteFilePath',
+               '_lastModifiedTime', '_lastSavedTime')
+
   def __init__(self, fileName: str=None):
     """Constructor. Initializes a new document.
 
@@ -34,27 +37,40 @@ class Document():
                 absolute or relative
     """
 
-    self._fileinfo = QFileInfo(fileName)
+    self._setFileName(fileName)
     self._lastModifiedTime = QDateTime()
     self._lastSavedTime = QDateTime()
 
 
+  def _setFileName(self, fileName: str):
+    """Point the document at fileName and cache the names derived from it.
+
+    The names are queried often by the UI, e.g. for tab text and tooltips,
+    so they are computed once here rather than on every access.
+    """
+
+    self._fileinfo = QFileInfo(fileName)
+    self._baseName = self._fileinfo.baseName()
+    self._fileName = self._fileinfo.fileName()
+    self._absoluteFilePath = self._fileinfo.absoluteFilePath()
+
+
   def name(self) -> str:
     """Return the file name."""
 
-    return self._fileinfo.baseName()
+    return self._baseName
 
 
   def fileName(self) -> str:
     """Return the file name with extension."""
 
-    return self._fileinfo.fileName()
+    return self._fileName
 
 
   def absoluteFilePath(self) -> str:
     """Return the absolute path to the file."""
 
-    return self._fileinfo.absoluteFilePath()
+    return self._absoluteFilePath
 
 
   def modified(self) -> bool:
@@ -81,7 +97,7 @@ class Document():
     Raises an exception on failure.
     """
 
-    pass
+    self._setFileName(fileName)
 
 
   def load(self, fileName: str):
@@ -90,4 +106,4 @@ class Document():
     Raises an exception on failure.
     """
 
-    pass
\ No newline at end of file
+    self._setFileName(fileName)
\ No newline at end of file
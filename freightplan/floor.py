@@ -22,6 +22,10 @@ represents. The grid increases to the right and downward, with the origin in
 the top left. Grid coordinates are represented as a typical (x,y) coordinate
 pair, starting from 0.
 
+Internally, the grid is stored as a single flat list of Tiles (or None for
+empty cells) in row-major order; Cell objects are only created on demand as
+views onto this storage.
+
 Conceptually, floors are essentially "layers", much like those found in
 graphics editing software. Much like these layers, floors are "stacked" on
 top of one another and can be freely added, removed, and rearranged.
@@ -65,6 +69,10 @@ class IdMixin():
   change over its lifetime.
   """
 
+  # Empty so that Sector, which also derives from QRect, has no layout conflict;
+  # slotted subclasses declare _id themselves.
+  __slots__ = ()
+
   def id(self) -> int:
     """Return the object ID."""
 
@@ -117,6 +125,9 @@ class Floor(IdMixin):
   logical "rooms" or "sectors" to break up parts of the floor.
   """
 
+  __slots__ = ('_id', '_name', '_level', '_plan', '_state', '_tiles',
+               '_tileCount', '_sectors')
+
   def __init__(self, name: str, level: int, plan: 'Plan',
                visible: bool=False, locked: bool=False):
     """Constructor.
@@ -136,22 +147,19 @@ class Floor(IdMixin):
       locked: Whether or not the floor contents can be changed.
     """
 
-    self.name = name
+    self.setName(name)
+    self._plan = plan
 
-    if level == None:
-      self.floor = self.nextHighestFloor()
+    if level is None:
+      self.setLevel(self.nextHighestFloor())
     else:
-      self.floor = level
+      self.setLevel(level)
 
     self._state = {'visible': visible, 'locked': locked}
-    self._grid = []
+    self._tiles = [None] * (GRID_SIZE * GRID_SIZE)
+    self._tileCount = 0
     self._sectors = {}
 
-    for y in range(GRID_SIZE):
-      for x in range(GRID_SIZE):
-        cellPos = QPoint(x, y)
-        self._grid.append(Cell(cellPos, self._grid))
-
 
   def name(self) -> str:
     """Return the floor name."""
@@ -199,27 +207,55 @@ class Floor(IdMixin):
 
 
   def cellAt(self, pos: QPoint) -> Cell:
-    """Return the Cell at the specified grid position via a QPoint."""
+    """Return the Cell at the specified grid position via a QPoint.
 
-    return self._grid[mapGridToIndex(pos)]
+    Cells are lightweight views onto the floor's grid and are created on
+    demand; changes made through the returned Cell are reflected in the floor.
+    """
+
+    return Cell(pos, self)
 
 
   def setCell(self, pos: QPoint, cell: Cell):
-    """Set the Cell at the specified grid position via a QPoint."""
+    """Set the Cell at the specified grid position via a QPoint.
+
+    Copies the contents of cell into the floor's grid at pos.
+    """
 
-    self._grid[mapGridToIndex(pos)] = cell
+    self.setTileAt(pos, cell.tile())
+
+
+  def tileAt(self, pos: QPoint) -> 'Tile':
+    """Return the Tile at the specified grid position, or None if empty."""
+
+    # mapGridToIndex() inlined; this is called for every cell a brush touches
+    return self._tiles[pos.y() * GRID_SIZE + pos.x()]
+
+
+  def setTileAt(self, pos: QPoint, tile: 'Tile'):
+    """Set the Tile at the specified grid position. None clears the cell."""
+
+    index = pos.y() * GRID_SIZE + pos.x()
+    self._tileCount += (tile is not None) - (self._tiles[index] is not None)
+    self._tiles[index] = tile
 
 
   def isEmpty(self) -> bool:
-    """Return whether or not the floor is empty.
+    """Return whether or not the floor is empty, i.e. no cell has a Tile."""
+
+    return self._tileCount == 0
 
-    Specifically, whether every cell's isEmpty() method returns true.
-    """
 
-    for cell in self._grid:
-      if not cell.isEmpty():
-        return False
-    return True
+  def tileCount(self) -> int:
+    """Return the number of cells on the floor that have a Tile."""
+
+    return self._tileCount
+
+
+  def tiles(self) -> list:
+    """Return a list of every Tile on the floor in row-major grid order."""
+
+    return [tile for tile in self._tiles if tile is not None]
 
 
   def sector(self, id: int) -> Sector:
@@ -228,6 +264,18 @@ class Floor(IdMixin):
     return self._sectors.get(id, None)
 
 
+  def sectorAt(self, pos: QPoint) -> Sector:
+    """Return the sector containing the given grid position, or None.
+
+    If sectors overlap, the most recently added one is returned.
+    """
+
+    for sector in reversed(list(self._sectors.values())):
+      if sector.contains(pos):
+        return sector
+    return None
+
+
   def addSector(self, sector: Sector):
     """Add the given sector to the layer."""
 
@@ -240,18 +288,38 @@ class Floor(IdMixin):
     del self._sectors[id]
 
 
-  def clone(self, level: int):
+  def clone(self, level: int) -> 'Floor':
     """Create a clone of this floor on the given level.
 
+    The clone has the same name, state and cell contents as this floor. Each
+    Tile is cloned, so the two floors never share a Tile.
+
     Args:
       level: Target level the clone should occupy.
+
+    Returns the new Floor.
     """
-    pass
+
+    floor = Floor(self._name, level, self._plan,
+                  visible=self.isVisible(), locked=self.isLocked())
+    floor._tiles[:] = [tile.clone() if tile is not None else None
+                       for tile in self._tiles]
+    floor._tileCount = self._tileCount
+    return floor
 
 
   def merge(self, target: 'Floor'):
-    """Merge this floor with the target floor."""
-    pass
+    """Merge this floor with the target floor.
+
+    Every empty cell of target receives a clone of the Tile in the same cell
+    of this floor; cells that are already occupied on target are left
+    untouched. Sectors are not merged.
+    """
+
+    merged = [theirs if theirs is not None or ours is None else ours.clone()
+              for theirs, ours in zip(target._tiles, self._tiles)]
+    target._tiles[:] = merged
+    target._tileCount = len(merged) - merged.count(None)
 
 
   def destroy(self):
@@ -20,10 +20,10 @@ A Tool that places Tiles on an Editor's editing area.
 """
 
 from PySide2 import QtGui
-from PySide2.QtCore import QPointF, Qt
-from PySide2.QtGui import QTransform
+from PySide2.QtCore import QPoint, QTimer, Qt
 from PySide2.QtWidgets import QGraphicsSceneMouseEvent
 
+from freightplan import FRAME_INTERVAL, GRID_SIZE
 from freightplan.gui.tile import Tile
 from freightplan.gui.tool import Tool
 
@@ -34,44 +34,48 @@ class BrushTool(Tool):
     """Constructor."""
 
     super().__init__(self, *args)
-    self.lastTilePos = None
+    self.lastTilePos = None  # Grid position as an (x, y) tuple
+    self._strokeCells = set()  # Cells already painted during the current drag
     self._selectedTile = None
+    self._selectedTileKey = None
+    self._selectedTileRect = None
+    self._selectedTileCenter = None
     self._tileRotation = 0
 
+    # Mouse movement is throttled; see mouseMoveEvent()
+    self._pendingMove = None
+    self._moveTimer = QTimer(self)
+    self._moveTimer.setSingleShot(True)
+    self._moveTimer.setInterval(FRAME_INTERVAL)
+    self._moveTimer.timeout.connect(self._processPendingMove)
 
-  def handleLeftButton(self, pos: QPointF) -> bool:
-    """Handles the left mouse button for the Editor area.
 
-    Returns whether or not the calling event should be accepted.
+  def handleLeftButton(self, coord: QPoint):
+    """Handles the left mouse button for the given grid position.
+
+    Places the selected tile, replacing any different tile already there.
     """
 
     editor = self._editor
-    coord = editor.sceneToGrid(pos)
-    item = editor.itemAtGridPos(coord, QTransform())
-    if isinstance(item, Tile):
+    tile = editor.itemAtGridPos(coord)
+    if tile is not None:
       # TODO: Handle different rotations
-      if item.pixmap().cacheKey() != self._selectedTile.cacheKey():
+      if tile.pixmapKey() != self._selectedTileKey:
         editor.removeTile(coord)
       else:
-        return False
-    editor.placeTile(Tile(self._selectedTile, editor.editArea), coord)
-    return True
+        return
+    editor.placeTile(Tile(self._selectedTile), coord)
 
 
-  def handleRightButton(self, pos: QPointF):
-    """Handles the right mouse button for the Editor area.
+  def handleRightButton(self, coord: QPoint):
+    """Handles the right mouse button for the given grid position.
 
-    Returns whether or not the calling event should be accepted.
+    Removes the tile there, if any.
     """
 
     editor = self._editor
-    coord = editor.sceneToGrid(pos)
-    item = editor.itemAtGridPos(coord, QTransform())
-    if isinstance(item, Tile):
+    if editor.itemAtGridPos(coord) is not None:
       editor.removeTile(coord)
-      return True
-    else:
-      return False
 
 
   def mousePressEvent(self, event: QGraphicsSceneMouseEvent):
@@ -82,34 +86,102 @@ class BrushTool(Tool):
     """
 
     editor = self._editor
-    pos = event.buttonDownScenePos(event.button())
+    button = event.button()
+    pos = event.buttonDownScenePos(button)
+    self._moveTimer.stop()
+    self._processPendingMove()  # Finish the previous drag before starting anew
+    self._strokeCells.clear()
     if editor.validGridPos(pos, scene=True):
-      self.lastTilePos = editor.sceneToGrid(pos)
-      if event.button() is Qt.LeftButton:
-        return self.handleLeftButton(pos)
-      elif event.button() is Qt.RightButton:
-        return self.handleRightButton(pos)
+      coord = editor.sceneToGrid(pos)
+      self.lastTilePos = (coord.x(), coord.y())
+      self._strokeCells.add(self.lastTilePos)
+      if button == Qt.LeftButton:
+        self.handleLeftButton(coord)
+      elif button == Qt.RightButton:
+        self.handleRightButton(coord)
 
 
   def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent):
     """Implementation.
 
     Handles mouse movement events in the editor. Dragging the mouse with a
-    button pressed will place or remove all tiles passed over.
+    button pressed will place or remove all tiles passed over. Each cell is
+    only handled once per drag, even if the cursor passes over it again.
+
+    Mice can report movement far more often than the screen refreshes, so
+    movement is throttled: only the most recent position is handled, at most
+    once every FRAME_INTERVAL milliseconds.
     """
 
+    self._pendingMove = (event.scenePos(), event.buttons())
+    if not self._moveTimer.isActive():
+      self._moveTimer.start()
+
+
+  def _processPendingMove(self):
+    """Handle the most recent mouse movement recorded by mouseMoveEvent()."""
+
+    if self._pendingMove is None:
+      return
+    pos, buttons = self._pendingMove
+    self._pendingMove = None
+
+    # Cells are compared as (x, y) tuples; a QPoint is only made for cells
+    # that are actually handled.
     editor = self._editor
-    pos = event.scenePos()
-    tilePos = editor.sceneToGrid(pos)
-    item = editor.itemAt(pos, QTransform())
+    tilePos = editor.sceneToGridXY(pos)
 
     if tilePos != self.lastTilePos:
+      prevPos = self.lastTilePos
       self.lastTilePos = tilePos
-      if editor.validGridPos(tilePos):
-        if event.buttons() & Qt.LeftButton:
-          return self.handleLeftButton(pos)
-        elif event.buttons() & Qt.RightButton:
-          return self.handleRightButton(pos)
+      if buttons & Qt.LeftButton:
+        handler = self.handleLeftButton
+      elif buttons & Qt.RightButton:
+        handler = self.handleRightButton
+      else:
+        return
+
+      # The cursor may have skipped over several cells since the last handled
+      # movement, so handle every cell along the way.
+      if prevPos is None:
+        path = (tilePos,)
+      else:
+        path = self._cellsBetween(prevPos, tilePos)
+      for cell in path:
+        x, y = cell
+        if not (0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE):
+          continue
+        if cell in self._strokeCells:
+          continue
+        self._strokeCells.add(cell)
+        handler(QPoint(x, y))
+
+
+  @staticmethod
+  def _cellsBetween(start: tuple, end: tuple):
+    """Yield the grid positions on the line from start to end.
+
+    Positions are given and yielded as (x, y) tuples. Uses Bresenham's line
+    algorithm, so each position yielded is adjacent to the previous one. start
+    itself is not yielded, but end is.
+    """
+
+    x, y = start
+    endX, endY = end
+    dx = abs(endX - x)
+    dy = -abs(endY - y)
+    stepX = 1 if x < endX else -1
+    stepY = 1 if y < endY else -1
+    err = dx + dy
+    while x != endX or y != endY:
+      err2 = err * 2
+      if err2 >= dy:
+        err += dy
+        x += stepX
+      if err2 <= dx:
+        err += dx
+        y += stepY
+      yield x, y
 
 
   def keyPressEvent(self, event):
@@ -122,7 +194,7 @@ class BrushTool(Tool):
       else:
         self._tileRotation += 90
       self._tileRotation %= 360
-      editor.editArea.update()
+      editor.editArea.ghost.update()
       return True
     else:
       return False
@@ -24,20 +24,26 @@ aide positioning and placement. EditorView is a subclass of a QGraphicsView
 that pairs with an Editor and displays it in the GUI.
 """
 
+import logging
+from bisect import bisect_left, bisect_right
+from math import ceil, floor
 from typing import Union
 
 import PySide2.QtGui as QtGui
 import PySide2.QtWidgets as QtWidgets
 from PySide2.QtCore import (
-  Signal, Slot, QEvent, QObject, QPoint, QPointF, QRectF, QSize, Qt
+  Signal, Slot, QEvent, QLineF, QObject, QPoint, QPointF, QRectF, QSize, Qt,
+  QTimer
+)
+from PySide2.QtGui import (
+  QBrush, QOpenGLContext, QPainter, QPen, QPixmap, QSurfaceFormat, QTransform
 )
-from PySide2.QtGui import QBrush, QPainter, QPen, QPixmap, QTransform
 from PySide2.QtWidgets import (
   QApplication, QGraphicsItem, QGraphicsObject, QGraphicsRectItem,
-  QGraphicsScene, QGraphicsView
+  QGraphicsScene, QGraphicsView, QOpenGLWidget
 )
 
-from freightplan import GRID_SIZE
+from freightplan import FRAME_INTERVAL, GRID_SIZE
 from freightplan.plan import Plan
 from freightplan.gui.tile import Tile
 from freightplan.gui.tool import Tool
@@ -45,6 +51,24 @@ from freightplan.gui.tool import Tool
 # TEMP
 import freightplan.gui.resources_rc
 
+log = logging.getLogger(__name__)
+
+# Plan.cellSize is fixed; keep it, and its reciprocal, at hand for the mouse
+# and paint handlers. Multiplying by the reciprocal is cheaper than dividing.
+_cellSize = Plan.cellSize
+_invCellSize = 1 / _cellSize
+
+# Scene position of the top-left corner of every grid cell, in row-major order.
+# The grid never changes size, so these are computed once rather than on every
+# mouse event or paint.
+_cellOrigins = tuple(QPointF(x * _cellSize, y * _cellSize)
+                     for y in range(GRID_SIZE) for x in range(GRID_SIZE))
+
+# Pens and brushes shared by every Editor
+_editAreaPen = QPen(Qt.gray)
+_editAreaBrush = QBrush('#5e6787', Qt.SolidPattern)
+_backgroundBrush = QBrush(Qt.lightGray)
+
 # TODO: slots for changing grid color, opacity, style, etc
 class EditorGrid(QGraphicsObject):
   """A graphics object responsible for drawing the editor grid."""
@@ -61,8 +85,19 @@ class EditorGrid(QGraphicsObject):
     self._pen = QPen(self._color)
     self._pen.setStyle(self._style)
 
+    # The grid's lines never change, so build them once up front. Lines are
+    # kept in order of position so paint() can pick out the exposed ones.
+    end = Plan.cellSize * GRID_SIZE
+    self._boundingRect = QRectF(0, 0, end, end)
+    self._vLines = tuple(QLineF(n, 0, n, end)
+                         for n in range(Plan.cellSize, end, Plan.cellSize))
+    self._hLines = tuple(QLineF(0, n, end, n)
+                         for n in range(Plan.cellSize, end, Plan.cellSize))
+
     self.setOpacity(self._opacity)
     self.setAcceptedMouseButtons(Qt.NoButton)
+    self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+    self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
 
 
   @Slot(bool)
@@ -71,15 +106,21 @@ class EditorGrid(QGraphicsObject):
 
 
   def boundingRect(self):
-    return self.parentItem().boundingRect()
+    return self._boundingRect
 
 
   def paint(self, painter, option, widget):
+    # Only draw the lines that cross the exposed part of the grid. Line i lies
+    # at (i + 1) * cellSize.
+    rect = option.exposedRect.intersected(self._boundingRect)
+    if rect.isEmpty():
+      return
+    left = max(ceil(rect.left() * _invCellSize) - 1, 0)
+    right = floor(rect.right() * _invCellSize)
+    top = max(ceil(rect.top() * _invCellSize) - 1, 0)
+    bottom = floor(rect.bottom() * _invCellSize)
     painter.setPen(self._pen)
-    end = Plan.cellSize * GRID_SIZE
-    for n in range(Plan.cellSize, end, Plan.cellSize):
-      painter.drawLine(n, 0, n, end)
-      painter.drawLine(0, n, end, n)
+    painter.drawLines(self._vLines[left:right] + self._hLines[top:bottom])
 
 
 class EditorView(QGraphicsView):
@@ -89,12 +130,16 @@ class EditorView(QGraphicsView):
   Editor.
   """
 
-  editor = QGraphicsView.scene  # Friendly alias
-
   panStarted = Signal(QPointF)
   panEnded = Signal(QPointF)
   zoomChanged = Signal(float)
 
+  # Zoom increments, in ascending order
+  _scaleFactors = (0.25, 0.33, 0.5, 0.75, 1, 1.5, 2, 3, 4, 5)
+
+  # Whether an OpenGL context can be created; checked by the first EditorView
+  _openGLAvailable = None
+
   def __init__(self, editor: 'Editor'):
     """Constructor.
 
@@ -104,19 +149,72 @@ class EditorView(QGraphicsView):
 
     super().__init__(editor)
 
+    # An EditorView only ever shows the Editor it was created with
+    self._editor = editor
     self._lastMousePos = QPoint()
-    self._scaleFactors = [
-      0.25, 0.33, 0.5, 0.75, 1, 1.5, 2, 3, 4, 5
-    ]
     self._currentScale = 1
 
+    # Wheel zooming is throttled; see wheelEvent()
+    self._pendingZoomSteps = 0
+    self._zoomTimer = QTimer(self)
+    self._zoomTimer.setSingleShot(True)
+    self._zoomTimer.setInterval(FRAME_INTERVAL)
+    self._zoomTimer.timeout.connect(self._processPendingZoom)
+
+    # Panning is throttled; see mouseMoveEvent()
+    self._pendingPanPos = None
+    self._panTimer = QTimer(self)
+    self._panTimer.setSingleShot(True)
+    self._panTimer.setInterval(FRAME_INTERVAL)
+    self._panTimer.timeout.connect(self._processPendingPan)
+
+    # The edit area never changes size; cached by updateSceneRect()
+    self._editAreaSize = None
+    self._editAreaCenter = None
+    self._sceneRectKey = None
+
+    # Render the scene with OpenGL where the system supports it. Everything in
+    # the editor is axis-aligned, so multisampling would only cost time. An
+    # OpenGL viewport can't repaint just part of itself, so it's always
+    # repainted in full; otherwise keep the raster viewport and only repaint
+    # the bounding rect of what changed.
+    glFormat = QSurfaceFormat()
+    glFormat.setSamples(0)
+    if EditorView._openGLAvailable is None:
+      context = QOpenGLContext()
+      context.setFormat(glFormat)
+      EditorView._openGLAvailable = context.create()
+    if self._openGLAvailable:
+      glViewport = QOpenGLWidget()
+      glViewport.setFormat(glFormat)
+      self.setViewport(glViewport)
+      self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+    else:
+      self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
+
     self.setMouseTracking(True)
     self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
     self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+    self.setOptimizationFlags(QGraphicsView.DontAdjustForAntialiasing
+                              | QGraphicsView.DontSavePainterState)
+
+    # Everything in the editor is drawn axis-aligned on whole pixels, so no
+    # antialiasing or smoothing of any kind is needed.
+    self.setRenderHints(QPainter.RenderHints())
+
+
+  def editor(self) -> 'Editor':
+    """Return the Editor this view shows."""
+
+    return self._editor
 
 
   def setZoom(self, factor: float):
-    """Set the view's zoom scale to factor."""
+    """Set the view's zoom scale to factor.
+
+    If factor isn't one of the view's zoom increments, zoomIn() and zoomOut()
+    step to the nearest increment above or below it.
+    """
 
     if factor == self._currentScale:
       return
@@ -130,10 +228,10 @@ class EditorView(QGraphicsView):
     Returns whether or not the view is able to zoom further.
     """
 
-    for factor in self._scaleFactors:
-      if factor > self._currentScale:
-        self.setZoom(factor)
-        return True
+    index = bisect_right(self._scaleFactors, self._currentScale)
+    if index < len(self._scaleFactors):
+      self.setZoom(self._scaleFactors[index])
+      return True
     return False
 
 
@@ -143,10 +241,10 @@ class EditorView(QGraphicsView):
     Returns whether or not the view is able to zoom further.
     """
 
-    for factor in reversed(self._scaleFactors):
-      if factor < self._currentScale:
-        self.setZoom(factor)
-        return True
+    index = bisect_left(self._scaleFactors, self._currentScale) - 1
+    if index >= 0:
+      self.setZoom(self._scaleFactors[index])
+      return True
     return False
 
 
@@ -186,21 +284,32 @@ class EditorView(QGraphicsView):
     Returns the updated scene bounding rectangle.
     """
 
+    # The scene rect only depends on the viewport's size and the zoom factor
+    viewportSize = self.maximumViewportSize()
+    key = (viewportSize.width(), viewportSize.height(), factor)
+    if key == self._sceneRectKey:
+      return self.sceneRect()
+    self._sceneRectKey = key
+
     # TODO: make configurable via Property
     margin = QSize(10, 10) # Between edge of grid and viewport
-    editAreaRect = self.editor().editArea.rect()
-    editAreaSize = editAreaRect.size().toSize()
+    if self._editAreaSize is None:
+      editAreaRect = self.editor().editArea.rect()
+      self._editAreaSize = editAreaRect.size().toSize()
+      self._editAreaCenter = editAreaRect.center()
+    editAreaSize = self._editAreaSize
 
     # Make the scene 2x larger than the viewport, minus the editing grid. This
     # allows us to pan the grid up to the edges of the viewport (minus margin),
     # but no further. Also ensure the scene is at least big enough to encompass
     # the entire grid.
-    sceneSize = self.maximumViewportSize() * 2 * (1 / factor)
+    sceneSize = viewportSize * 2 * (1 / factor)
     sceneSize = sceneSize - editAreaSize - margin
     sceneSize = sceneSize.expandedTo(editAreaSize + margin)
     newSceneRect = QRectF(QPointF(0,0), sceneSize)
-    newSceneRect.moveCenter(editAreaRect.center())
-    self.setSceneRect(newSceneRect)
+    newSceneRect.moveCenter(self._editAreaCenter)
+    if newSceneRect != self.sceneRect():
+      self.setSceneRect(newSceneRect)
 
     return newSceneRect
 
@@ -210,54 +319,94 @@ class EditorView(QGraphicsView):
   def wheelEvent(self, event: QtGui.QWheelEvent):
     """Implementation.
 
-    Handles zooming the editor's view.
+    Handles zooming the editor's view. Wheel events can arrive far more often
+    than the screen refreshes, so zoom steps are accumulated and applied
+    together at most once every FRAME_INTERVAL milliseconds.
     """
 
     if (event.modifiers() & Qt.ControlModifier
         and event.orientation() == Qt.Vertical):
-      if event.delta() > 0:
-        self.zoomIn()
-      else:
-        self.zoomOut()
-
-      # TODO: Improve cursor anchoring; be more like Aseprite
-      prevAnchor = self.transformationAnchor()
-      self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
-      self.setTransform(QTransform.fromScale(self.zoom(), self.zoom()))
-      self.updateSceneRect(self.zoom())
-      self.setTransformationAnchor(prevAnchor)
+      self._pendingZoomSteps += 1 if event.delta() > 0 else -1
+      if not self._zoomTimer.isActive():
+        self._zoomTimer.start()
       event.accept()
     elif event.orientation() == Qt.Horizontal:
       # XXX: Workaround for the insane horizontal scroll delta of 15240 on the
-      # Logitech G502 mouse.
+      # Logitech G502 mouse. Scroll by a single notch's worth, as the scroll
+      # bar would for a normal delta of 120, rather than building a new event.
       if abs(event.delta()) == 15240:
-        newDelta = 120 if event.delta() > 0 else -120
-        event = QtGui.QWheelEvent(
-          event.pos(), event.globalPos(), newDelta, event.buttons(),
-          event.modifiers(), orient=Qt.Horizontal
-        )
-      super().wheelEvent(event)
+        hBar = self.horizontalScrollBar()
+        step = hBar.singleStep() * QApplication.wheelScrollLines()
+        if event.delta() > 0:
+          step = -step
+        hBar.setValue(hBar.value() + step)
+        event.accept()
+      else:
+        super().wheelEvent(event)
     else:
       super().wheelEvent(event)
 
 
+  def _processPendingZoom(self):
+    """Apply the zoom steps accumulated by wheelEvent()."""
+
+    steps = self._pendingZoomSteps
+    self._pendingZoomSteps = 0
+    prevScale = self._currentScale
+    while steps > 0 and self.zoomIn():
+      steps -= 1
+    while steps < 0 and self.zoomOut():
+      steps += 1
+    if self._currentScale == prevScale:
+      return
+
+    # TODO: Improve cursor anchoring; be more like Aseprite
+    # Rescaling and resizing the scene each repaint the viewport; suspend
+    # updates so they're combined into a single repaint.
+    prevAnchor = self.transformationAnchor()
+    self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+    self.setUpdatesEnabled(False)
+    try:
+      self.setTransform(QTransform.fromScale(self.zoom(), self.zoom()))
+      self.updateSceneRect(self.zoom())
+    finally:
+      self.setUpdatesEnabled(True)
+      self.viewport().update()
+    self.setTransformationAnchor(prevAnchor)
+
+
   def mouseMoveEvent(self, event: QtGui.QMouseEvent):
     """Implementation.
 
-    Handles panning the editor view.
+    Handles panning the editor view. Like zooming, panning is throttled to at
+    most once every FRAME_INTERVAL milliseconds; the view scrolls by the
+    total distance moved since the last pan.
     """
 
     if event.buttons() & Qt.MiddleButton:
-      delta = self._lastMousePos - event.pos()
-      hBar = self.horizontalScrollBar()
-      vBar = self.verticalScrollBar()
-      hBar.setValue(hBar.value() + delta.x())
-      vBar.setValue(vBar.value() + delta.y())
-      self._lastMousePos = event.pos()
+      self._pendingPanPos = event.pos()
+      if not self._panTimer.isActive():
+        self._panTimer.start()
 
     super().mouseMoveEvent(event)
 
 
+  def _processPendingPan(self):
+    """Scroll the view to the most recent position recorded while panning."""
+
+    if self._pendingPanPos is None:
+      return
+    pos = self._pendingPanPos
+    self._pendingPanPos = None
+
+    delta = self._lastMousePos - pos
+    hBar = self.horizontalScrollBar()
+    vBar = self.verticalScrollBar()
+    hBar.setValue(hBar.value() + delta.x())
+    vBar.setValue(vBar.value() + delta.y())
+    self._lastMousePos = pos
+
+
   def mousePressEvent(self, event):
     """Implementation.
 
@@ -282,12 +431,59 @@ class EditorView(QGraphicsView):
 
     pos = event.pos()
     if event.button() == Qt.MiddleButton:
+      self._panTimer.stop()
+      self._processPendingPan()
       QApplication.restoreOverrideCursor()
       self.panEnded.emit(self.mapToScene(pos))
 
     super().mouseReleaseEvent(event)
 
 
+class HoverGhostItem(QGraphicsItem):
+  """Graphics item that draws a "ghost" of the tile brush over a grid cell.
+
+  Kept separate from EditArea so that moving the ghost between cells only
+  invalidates the cells involved, rather than the cached edit area.
+  """
+
+  def __init__(self, editor: 'Editor', parent: QGraphicsItem):
+    """Constructor."""
+
+    super().__init__(parent)
+
+    self.editor = editor
+    self._boundingRect = QRectF(0, 0, Plan.cellSize, Plan.cellSize)
+
+    # Draw above placed tiles
+    self.setZValue(1)
+    self.setAcceptedMouseButtons(Qt.NoButton)
+    self.setVisible(False)
+
+
+  def boundingRect(self):
+    return self._boundingRect
+
+
+  def paint(self, painter, option, widget):
+    """Implementation.
+
+    Draws the current tool's tile brush, rotated and translucent.
+    """
+
+    tool = self.editor.currentTool()
+    if tool is None:
+      return
+
+    pixmap = tool._selectedTile
+    if pixmap:
+      fragment = QPainter.PixmapFragment.create(
+        tool._selectedTileCenter, tool._selectedTileRect,
+        rotation=tool._tileRotation,
+        opacity=0.75
+      )
+      painter.drawPixmapFragments(fragment, 1, pixmap)
+
+
 class EditArea(QGraphicsRectItem):
   """QGraphicsRectItem representing the editing area."""
 
@@ -300,77 +496,87 @@ class EditArea(QGraphicsRectItem):
     self._hoveredCell = None
     self.lastTilePos = None
 
-    self.setPen(QPen(Qt.gray))
-    self.setBrush(QBrush('#5e6787', Qt.SolidPattern))
+    # Hover movement is throttled; see hoverMoveEvent()
+    self._pendingHoverPos = None
+    self._hoverTimer = QTimer(editor)
+    self._hoverTimer.setSingleShot(True)
+    self._hoverTimer.setInterval(FRAME_INTERVAL)
+    self._hoverTimer.timeout.connect(self._processPendingHover)
+
+    self.setPen(_editAreaPen)
+    self.setBrush(_editAreaBrush)
     self.setAcceptHoverEvents(True)
+    self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+    self.ghost = HoverGhostItem(editor, self)
     self.editor.addItem(self)
 
 
+  def hoveredCell(self) -> QPoint:
+    """Return the grid position of the hovered cell, or None."""
+
+    return self._hoveredCell
+
+
   @Slot()
   def unsetHoveredCell(self):
     """Unsets the currently hovered cell."""
 
     self._hoveredCell = None
-    self.update()
+    self.ghost.setVisible(False)
 
 
-  @Slot(QPointF)
-  def setHoveredCell(self, pos: Union[QPoint, QPointF]):
+  @Slot(QPoint)
+  def setHoveredCellGrid(self, pos: QPoint):
     """Sets the currently hovered cell.
 
     Args:
-      pos: If given as a QPoint, specifies the position of the cell in grid
-           coordinates. If given as a QPointF, specifies the position of the
-           cell in scene coordinates.
+      pos: The position of the cell in grid coordinates.
     """
 
-    if isinstance(pos, QPointF):
-      pos = Editor.sceneToGrid(pos)
-
     if Editor.validGridPos(pos):
       self._hoveredCell = pos
     else:
       raise ValueError('Cannot set hovered cell to invalid position ({}, {})'
                        .format(pos.x(), pos.y()))
-    self.update()
+    self.ghost.setPos(Editor.cellOrigin(pos))
+    self.ghost.setVisible(True)
 
 
-  def paint(self, painter, option, widget):
-    """Implementation.
+  @Slot(QPointF)
+  def setHoveredCellScene(self, pos: QPointF):
+    """Sets the currently hovered cell.
 
-    Handle drawing "ghost" tiles when hovering over grid cells.
+    Args:
+      pos: The position of the cell in scene coordinates.
     """
 
-    super().paint(painter, option, widget)
-
-    tool = self.editor.currentTool()
-    if tool is None:
-      return
-
-    pixmap = tool._selectedTile
-    if self._hoveredCell and pixmap:
-      scenePos = Editor.gridToScene(self._hoveredCell)
-      fragment = QPainter.PixmapFragment.create(
-        scenePos + QPointF(pixmap.width() / 2, pixmap.height() / 2),
-        QRectF(QPointF(0, 0), pixmap.size()),
-        rotation=tool._tileRotation,
-        opacity=0.75
-      )
-      painter.drawPixmapFragments(fragment, 1, pixmap)
+    self.setHoveredCellGrid(Editor.sceneToGrid(pos))
 
 
   def hoverMoveEvent(self, event):
     """Implementation.
 
     Keeps track of the cell the cursor is hovering over for other events to
-    make use of.
+    make use of. Like BrushTool's mouse movement, hover movement is throttled
+    to at most once every FRAME_INTERVAL milliseconds.
     """
 
-    pos = Editor.sceneToGrid(event.pos())
+    self._pendingHoverPos = event.pos()
+    if not self._hoverTimer.isActive():
+      self._hoverTimer.start()
+
+
+  def _processPendingHover(self):
+    """Handle the most recent hover position recorded by hoverMoveEvent()."""
+
+    if self._pendingHoverPos is None:
+      return
+    pos = Editor.sceneToGrid(self._pendingHoverPos)
+    self._pendingHoverPos = None
     if Editor.validGridPos(pos):
       if pos != self.lastTilePos:
         self.lastTilePos = pos
-        self.setHoveredCell(pos)
+        self.setHoveredCellGrid(pos)
     else:
       self.unsetHoveredCell()
 
@@ -378,6 +584,8 @@ class EditArea(QGraphicsRectItem):
   def hoverLeaveEvent(self, event):
     """Implementation."""
 
+    self._hoverTimer.stop()
+    self._pendingHoverPos = None
     self.unsetHoveredCell()
 
 
@@ -401,7 +609,7 @@ class Editor(QGraphicsScene):
     self.plan = plan
     self.lastTilePos = None
     self.view = EditorView(self)
-    self.setBackgroundBrush(QBrush(Qt.lightGray))
+    self.setBackgroundBrush(_backgroundBrush)
 
     self._currentFloor = 0
     self._currentTool = None
@@ -415,21 +623,42 @@ class Editor(QGraphicsScene):
     self.view.centerOn(borderRect.center())
 
     self.view.panStarted.connect(self.editArea.unsetHoveredCell)
-    self.view.panEnded.connect(self.editArea.setHoveredCell)
+    self.view.panEnded.connect(self._onPanEnded)
 
 
   @staticmethod
   def sceneToGrid(pos: QPointF) -> QPoint:
     """Map a scene position to grid coordinates."""
 
-    return QPoint(pos.x() // Plan.cellSize, pos.y() // Plan.cellSize)
+    return QPoint(floor(pos.x() * _invCellSize), floor(pos.y() * _invCellSize))
+
+
+  @staticmethod
+  def sceneToGridXY(pos: QPointF) -> tuple:
+    """Map a scene position to grid coordinates, given as an (x, y) tuple.
+
+    Cheaper than sceneToGrid() when a QPoint isn't needed.
+    """
+
+    return floor(pos.x() * _invCellSize), floor(pos.y() * _invCellSize)
 
 
   @staticmethod
   def gridToScene(pos: QPoint) -> QPointF:
     """Map grid coordinates to a scene position."""
 
-    return QPointF(pos.x() * Plan.cellSize, pos.y() * Plan.cellSize)
+    return QPointF(pos.x() * _cellSize, pos.y() * _cellSize)
+
+
+  @staticmethod
+  def cellOrigin(pos: QPoint) -> QPointF:
+    """Return the scene position of the top-left corner of the cell at pos.
+
+    Equivalent to gridToScene(), but pos must be a valid grid position. The
+    returned QPointF is shared and must not be modified.
+    """
+
+    return _cellOrigins[pos.y() * GRID_SIZE + pos.x()]
 
 
   @staticmethod
@@ -442,8 +671,11 @@ class Editor(QGraphicsScene):
              grid coordinate. Defaults to false, i.e. a grid coordinate.
     """
 
-    coord = __class__.sceneToGrid(pos) if scene else pos
-    return 0 <= coord.x() < GRID_SIZE and 0 <= coord.y() < GRID_SIZE
+    if scene:
+      x, y = __class__.sceneToGridXY(pos)
+    else:
+      x, y = pos.x(), pos.y()
+    return 0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE
 
 
   def setTileBrush(self, pixmap: QPixmap):
@@ -457,9 +689,27 @@ class Editor(QGraphicsScene):
     tool = self.currentTool()
     if tool is not None:
       tool._selectedTile = pixmap
+      tool._selectedTileKey = pixmap.cacheKey()
+      tool._selectedTileRect = QRectF(pixmap.rect())
+      tool._selectedTileCenter = tool._selectedTileRect.center()
       tool._tileRotation = 0
 
 
+  @Slot(QPointF)
+  def _onPanEnded(self, pos: QPointF):
+    """Restore the hovered cell once the view is done panning.
+
+    The pan may end with the cursor outside of the grid, in which case there
+    is no cell to hover.
+    """
+
+    coord = self.sceneToGrid(pos)
+    if self.validGridPos(coord):
+      self.editArea.setHoveredCellGrid(coord)
+    else:
+      self.editArea.unsetHoveredCell()
+
+
   def currentFloor(self) -> 'Floor':
     """Return the currently active Floor object."""
 
@@ -472,36 +722,35 @@ class Editor(QGraphicsScene):
     return self._currentTool
 
 
-  def itemAtGridPos(self, pos: QPoint, transform: QTransform) -> QGraphicsItem:
-    """Return the QGraphicsItem at the specified grid coordinate.
-
-    Functions similarly to the base itemAt() method."""
+  def itemAtGridPos(self, pos: QPoint) -> Tile:
+    """Return the Tile at the specified grid coordinate, or None if empty.
 
-    # Adjust the position to the center of the grid cell to ensure the item is
-    # under the cursor. Items with even dimensions have a sub-pixel center,
-    # causing it to be shifted one pixel when rotating.
-    center = Plan.cellSize / 2
-    scenePos = self.gridToScene(pos) + QPointF(center, center)
+    Looks the tile up directly in the current Floor rather than querying the
+    scene.
+    """
 
-    return self.itemAt(scenePos, transform)
+    return self.currentFloor().tileAt(pos)
 
 
   def placeTile(self, tile: Tile, pos: QPoint):
     """Place a tile on the Editor.
 
     Args:
-      tile: The tile to place.
+      tile: The tile to place. Should not yet have a parent item; it is made
+            a child of the edit area once positioned.
       pos: The position in grid coordinates to place the tile, given as a
            QPoint.
     """
 
     if self.validGridPos(pos):
       self.currentFloor().cellAt(pos).setTile(tile)
-      tile.setVisible(True)
+      # Position the tile before adding it to the edit area so that the scene
+      # only has to invalidate its final location, once.
       tile.setRotation(self.currentTool()._tileRotation)
-      scenePos = self.gridToScene(pos)
-      tile.setPos(scenePos)
-      print(f'Placed tile at {pos!s}')
+      tile.setPos(self.cellOrigin(pos))
+      tile.setParentItem(self.editArea)
+      if log.isEnabledFor(logging.DEBUG):
+        log.debug('Placed tile at %s', pos)
     else:
       raise ValueError(f'Grid position out of bounds: {pos.x()}, {pos.y()}')
 
@@ -518,7 +767,8 @@ class Editor(QGraphicsScene):
       cell = self.currentFloor().cellAt(pos)
       self.removeItem(cell.tile())
       cell.clearTile()
-      print(f'Removed tile at {pos!s}')
+      if log.isEnabledFor(logging.DEBUG):
+        log.debug('Removed tile at %s', pos)
     else:
       raise ValueError(f'Grid position out of bounds: {pos.x()}, {pos.y()}')
 
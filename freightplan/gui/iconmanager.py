@@ -24,6 +24,7 @@ from PySide2.QtGui import QIcon, QPixmap
 import freightplan.gui.resources_rc
 
 _iconCache = {}
+_pixmapCache = {}
 
 def getIcon(name: str) -> QIcon:
   """Return the icon with the given name."""
@@ -34,6 +35,13 @@ def getIcon(name: str) -> QIcon:
   return _iconCache[name]
 
 def getPixmap(name: str) -> QPixmap:
-  """Return the icon with the given name as a pixmap."""
+  """Return the icon with the given name as a pixmap.
 
-  return getIcon(name).pixmap()
\ No newline at end of file
+  The pixmap is loaded directly from the image resource once and shared by
+  every caller.
+  """
+
+  if name not in _pixmapCache:
+    _pixmapCache[name] = QPixmap(f':/images/components/{name}')
+
+  return _pixmapCache[name]
\ No newline at end of file
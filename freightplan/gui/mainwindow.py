@@ -22,6 +22,7 @@ and so on.
 """
 
 import platform
+from operator import attrgetter
 
 from PySide2.QtCore import Slot, Qt
 from PySide2.QtGui import QKeySequence
@@ -32,6 +33,60 @@ from freightplan import APP_NAME
 from freightplan.planmanager import PlanManager
 from freightplan.gui import Editor, Palette, Sidebar
 
+_isDarwin = platform.system() == 'Darwin'
+
+# Custom shortcuts are built once here. Standard keys are left as they are,
+# since they can't be resolved for the platform until the application exists.
+_prefsShortcut = QKeySequence(Qt.CTRL + Qt.Key_P)
+
+# The actions created by MainWindow.create_actions(), in the form:
+#   (key, text, shortcut, status tip, slot, menu role)
+# slot names the MainWindow attribute to connect the action's triggered signal
+# to, e.g. 'manager.newPlan'. Fields that don't apply are None.
+_actionSpecs = (
+  ('new', '&New Plan', QKeySequence.New, 'Create a new plan',
+   'manager.newPlan', None),
+  ('open', '&Open Plan...', QKeySequence.Open, 'Open an existing plan',
+   'manager.openPlan', None),
+  ('reopen', '&Reopen Closed Plan',
+   QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_T),
+   'Open the most recently closed plan', None, None),
+  ('recent_clear', '&Clear Recent Plans', None,
+   'Clear the recently opened plans list', None, None),
+  # Annoyingly, the QKeySequence.Close primary is Ctrl+F4 on Windows
+  ('close', '&Close Plan', QKeySequence(Qt.CTRL + Qt.Key_W),
+   'Close the currently active plan', 'manager.closePlan', None),
+  ('save', '&Save Plan', QKeySequence.Save, 'Save the currently active plan',
+   'manager.savePlan', None),
+  ('save_as', 'Save Plan &As', QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_S),
+   'Save the currently active plan under a different name',
+   'manager.savePlanAs', None),
+  ('exit', 'E&xit', QKeySequence(Qt.CTRL + Qt.Key_Q), f'Exit {APP_NAME}',
+   'close', QAction.MenuRole.QuitRole),
+  ('undo', '&Undo', QKeySequence.Undo, None, None, None),
+  ('redo', '&Redo', QKeySequence.Redo, None, None, None),
+  ('cut', 'Cu&t', QKeySequence.Cut, None, None, None),
+  ('copy', '&Copy', QKeySequence.Copy, None, None, None),
+  ('paste', '&Paste', QKeySequence.Paste, None, None, None),
+  # Shortcut is platform-dependent; see create_actions()
+  ('prefs', 'Pre&ferences', None, None, None,
+   QAction.MenuRole.PreferencesRole),
+  ('grid_show', 'Show &Grid', QKeySequence(Qt.CTRL + Qt.Key_G),
+   'Toggle display of the editor grid', None, None),
+  # TODO: Make a single-window About page with Qt info in a separate pane/tab
+  # like other applications
+  ('about', '&About', None, f'Show information about {APP_NAME}', None,
+   QAction.MenuRole.AboutRole),
+  ('about_qt', 'About &Qt', None, 'Show information about the Qt library',
+   None, QAction.MenuRole.AboutQtRole),
+)
+
+class _Actions:
+  """Holds the MainWindow's actions as attributes named after their keys."""
+
+  __slots__ = tuple(spec[0] for spec in _actionSpecs)
+
+
 class MainWindow(QMainWindow):
   """Main application window for freightplan.
 
@@ -42,7 +97,7 @@ class MainWindow(QMainWindow):
 
     super().__init__()
 
-    self.action = {}
+    self.action = _Actions()
 
     self.setWindowTitle(APP_NAME)
     self.resize(640, 480) # TEMP
@@ -68,123 +123,65 @@ class MainWindow(QMainWindow):
   def create_actions(self):
     """Create the QActions used by the MainWindow."""
 
-    self.action['new'] = QAction('&New Plan', self)
-    self.action['new'].setShortcut(QKeySequence.New)
-    self.action['new'].setStatusTip('Create a new plan')
-    self.action['new'].triggered.connect(self.manager.newPlan)
-
-    self.action['open'] = QAction('&Open Plan...', self)
-    self.action['open'].setShortcut(QKeySequence.Open)
-    self.action['open'].setStatusTip('Open an existing plan')
-    self.action['open'].triggered.connect(self.manager.openPlan)
-
-    self.action['reopen'] = QAction('&Reopen Closed Plan', self)
-    self.action['reopen'].setShortcut(Qt.CTRL + Qt.SHIFT + Qt.Key_T)
-    self.action['reopen'].setStatusTip('Open the most recently closed plan')
-
-    self.action['recent_clear'] = QAction('&Clear Recent Plans', self)
-    self.action['recent_clear'].setStatusTip('Clear the recently opened plans '
-                                             'list')
-
-    self.action['close'] = QAction('&Close Plan', self)
-    # Annoyingly, the QKeySequence.Close primary is Ctrl+F4 on Windows
-    self.action['close'].setShortcut(Qt.CTRL + Qt.Key_W)
-    self.action['close'].setStatusTip('Close the currently active plan')
-    self.action['close'].triggered.connect(self.manager.closePlan)
-
-    self.action['save'] = QAction('&Save Plan', self)
-    self.action['save'].setShortcut(QKeySequence.Save)
-    self.action['save'].setStatusTip('Save the currently active plan')
-    self.action['save'].triggered.connect(self.manager.savePlan)
-
-    self.action['save_as'] = QAction('Save Plan &As', self)
-    self.action['save_as'].setShortcut(Qt.CTRL + Qt.SHIFT + Qt.Key_S)
-    self.action['save_as'].setStatusTip('Save the currently active plan under '
-                                        'a different name')
-    self.action['save_as'].triggered.connect(self.manager.savePlanAs)
-
-    self.action['exit'] = QAction('E&xit', self)
-    self.action['exit'].setShortcut(Qt.CTRL + Qt.Key_Q)
-    self.action['exit'].setStatusTip(f'Exit {APP_NAME}')
-    self.action['exit'].setMenuRole(QAction.MenuRole.QuitRole)
-    self.action['exit'].triggered.connect(self.close)
-
-    self.action['undo'] = QAction('&Undo', self)
-    self.action['undo'].setShortcut(QKeySequence.Undo)
-
-    self.action['redo'] = QAction('&Redo', self)
-    self.action['redo'].setShortcut(QKeySequence.Redo)
-
-    self.action['cut'] = QAction('Cu&t', self)
-    self.action['cut'].setShortcut(QKeySequence.Cut)
-
-    self.action['copy'] = QAction('&Copy', self)
-    self.action['copy'].setShortcut(QKeySequence.Copy)
-
-    self.action['paste'] = QAction('&Paste', self)
-    self.action['paste'].setShortcut(QKeySequence.Paste)
-
-    self.action['prefs'] = QAction('Pre&ferences', self)
-    if platform.system() == 'Darwin':
-      self.action['prefs'].setShortcut(QKeySequence.Preferences)
+    for key, text, shortcut, statusTip, slot, menuRole in _actionSpecs:
+      action = QAction(text, self)
+      if shortcut is not None:
+        action.setShortcut(shortcut)
+      if statusTip is not None:
+        action.setStatusTip(statusTip)
+      if menuRole is not None:
+        action.setMenuRole(menuRole)
+      if slot is not None:
+        action.triggered.connect(attrgetter(slot)(self))
+      setattr(self.action, key, action)
+
+    if _isDarwin:
+      self.action.prefs.setShortcut(QKeySequence.Preferences)
     else:
-      self.action['prefs'].setShortcut(Qt.CTRL + Qt.Key_P)
-    self.action['prefs'].setMenuRole(QAction.MenuRole.PreferencesRole)
-
-    self.action['grid_show'] = QAction('Show &Grid', self)
-    self.action['grid_show'].setCheckable(True)
-    self.action['grid_show'].setChecked(True)
-    self.action['grid_show'].setShortcut(Qt.CTRL + Qt.Key_G)
-    self.action['grid_show'].setStatusTip('Toggle display of the editor grid')
-
-    # TODO: Make a single-window About page with Qt info in a separate pane/tab
-    # like other applications
-    self.action['about'] = QAction('&About', self)
-    self.action['about'].setMenuRole(QAction.MenuRole.AboutRole)
-    self.action['about'].setStatusTip(f'Show information about {APP_NAME}')
-
-    self.action['about_qt'] = QAction('About &Qt', self)
-    self.action['about_qt'].setMenuRole(QAction.MenuRole.AboutQtRole)
-    self.action['about_qt'].setStatusTip('Show information about the Qt library')
-    self.action['about_qt'].triggered \
-                           .connect(lambda x: QMessageBox.aboutQt(self))
+      self.action.prefs.setShortcut(_prefsShortcut)
+
+    self.action.grid_show.setCheckable(True)
+    self.action.grid_show.setChecked(True)
+
+    self.action.about_qt.triggered \
+                        .connect(lambda x: QMessageBox.aboutQt(self))
 
   def create_menus(self):
     """Create the QMenus for the menubar."""
 
     menu_file = self.menubar.addMenu('&File')
-    menu_file.addAction(self.action['new'])
-    menu_file.addAction(self.action['open'])
+    menu_file.addAction(self.action.new)
+    menu_file.addAction(self.action.open)
 
     menu_recent = menu_file.addMenu('Open &Recent')
-    menu_recent.addAction(self.action['reopen'])
+    menu_recent.addAction(self.action.reopen)
     menu_recent.addSeparator()
     menu_recent.addAction('Recent plans not yet implemented') \
                .setDisabled(True) # TEMP
     menu_recent.addSeparator()
-    menu_recent.addAction(self.action['recent_clear'])
+    menu_recent.addAction(self.action.recent_clear)
 
-    menu_file.addAction(self.action['close'])
+    menu_file.addAction(self.action.close)
     menu_file.addSeparator()
-    menu_file.addAction(self.action['save'])
-    menu_file.addAction(self.action['save_as'])
+    menu_file.addAction(self.action.save)
+    menu_file.addAction(self.action.save_as)
     menu_file.addSeparator()
-    menu_file.addAction(self.action['exit'])
+    menu_file.addAction(self.action.exit)
 
     menu_edit = self.menubar.addMenu('&Edit')
-    menu_edit.addAction(self.action['undo'])
-    menu_edit.addAction(self.action['redo'])
+    menu_edit.addAction(self.action.undo)
+    menu_edit.addAction(self.action.redo)
     menu_edit.addSeparator()
-    menu_edit.addAction(self.action['cut'])
-    menu_edit.addAction(self.action['copy'])
-    menu_edit.addAction(self.action['paste'])
+    menu_edit.addAction(self.action.cut)
+    menu_edit.addAction(self.action.copy)
+    menu_edit.addAction(self.action.paste)
 
     menu_view = self.menubar.addMenu('&View')
-    menu_view.addAction(self.action['grid_show'])
+    menu_view.addAction(self.action.grid_show)
 
     menu_help = self.menubar.addMenu('&Help')
-    menu_help.addAction(self.action['about'])
-    menu_help.addAction(self.action['about_qt'])
+    menu_help.addAction(self.action.about)
+    menu_help.addAction(self.action.about_qt)
 
 
   @Slot(int)
@@ -199,7 +196,7 @@ class MainWindow(QMainWindow):
     """
 
     lastTab = self.manager.lastTab()
-    gridShow = self.action['grid_show']
+    gridShow = self.action.grid_show
     if lastTab != -1:
       prevEditor = self.manager.editorAt(lastTab)
       gridShow.triggered.disconnect(prevEditor.grid.setVisible)
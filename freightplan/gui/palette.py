@@ -21,7 +21,7 @@ within a freighter. Each displayed component is a selectable "swatch" that
 determines what tile is placed on the grid.
 """
 
-from PySide2.QtCore import Signal, Slot, QObject
+from PySide2.QtCore import Signal, QObject
 from PySide2.QtGui import QIcon, QPixmap
 from PySide2.QtWidgets import (
   QDockWidget, QFrame, QGridLayout, QLabel, QPushButton, QVBoxLayout
@@ -39,13 +39,10 @@ def _addToGridLayout(widgets: list, grid: QGridLayout, columns: int):
     columns: How many columns will be filled before starting a new row.
     """
 
-  row = col = 0
-  for widget in widgets:
-    grid.addWidget(widget, row, col)
-    col += 1
-    if col == columns:
-      row += 1
-      col = 0
+  addWidget = grid.addWidget
+  for i, widget in enumerate(widgets):
+    row, col = divmod(i, columns)
+    addWidget(widget, row, col)
 
 
 # TBD: Design of the palette
@@ -58,7 +55,7 @@ def _addToGridLayout(widgets: list, grid: QGridLayout, columns: int):
 class Palette(QDockWidget):
   """Frame containing the freighter components palette."""
 
-  componentSelected = Signal(type(Components.ComponentID))
+  componentSelected = Signal(Components.ComponentID)
 
   def __init__(self, parent=None):
     """Constructor.
@@ -75,24 +72,19 @@ class Palette(QDockWidget):
     self.layout = QVBoxLayout(self.frame)
 
     self.buttons = {}
+    frame = self.frame
     for component in Components.componentList():
-      button = QPushButton(component.icon(), '', self.frame)
+      cid = component.cid()
+      button = QPushButton(component.icon(), '', frame)
       button.setToolTip(component.name())
-      button.setProperty('cid', component.cid())
-      button.clicked.connect(self._buttonHandler)
-      self.buttons[component.cid().name] = button
+      # Bind each button's ComponentID now rather than looking it up per click
+      button.clicked.connect(
+        lambda checked=False, cid=cid: self.componentSelected.emit(cid)
+      )
+      self.buttons[cid] = button
 
     self.layout.addWidget(QLabel('Corridors'))
     self.buttongrid = QGridLayout()
     self.layout.addLayout(self.buttongrid)
     _addToGridLayout(self.buttons.values(), self.buttongrid, 3)
     self.layout.addStretch(99)
-
-
-  @Slot()
-  def _buttonHandler(self):
-    """Intermediary function to feed the componentSelected signal the
-    button's associated ComponentID.
-    """
-
-    self.componentSelected.emit(self.sender().property('cid'))
\ No newline at end of file
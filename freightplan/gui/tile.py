@@ -26,15 +26,16 @@ from PySide2.QtWidgets import QGraphicsItem, QGraphicsPixmapItem
 class Tile(QGraphicsPixmapItem):
   """Represents a placed component on the Editor grid."""
 
-  def __init__(self, pixmap: QPixmap, parent: QGraphicsItem):
+  def __init__(self, pixmap: QPixmap, parent: QGraphicsItem=None):
     """Constructor.
 
     Args:
       pixmap: The QPixmap to display for the tile.
-      parent: The QGraphicsItem that this tile is a child of.
+      parent: The QGraphicsItem that this tile is a child of, if any.
     """
 
     super().__init__(pixmap, parent)
+    self._pixmapKey = pixmap.cacheKey()
 
     # Ensure the shape consists of the whole pixmap and not just the opaque
     # portion to ensure we select the Tile.
@@ -43,6 +44,37 @@ class Tile(QGraphicsPixmapItem):
     self.setTransformOriginPoint(self.boundingRect().center())
 
 
+  def setPixmap(self, pixmap: QPixmap):
+    """Implementation.
+
+    Keeps pixmapKey() up to date with the new pixmap.
+    """
+
+    super().setPixmap(pixmap)
+    self._pixmapKey = pixmap.cacheKey()
+
+
+  def pixmapKey(self) -> int:
+    """Return the cache key of the tile's pixmap.
+
+    Equivalent to pixmap().cacheKey(), without copying the pixmap.
+    """
+
+    return self._pixmapKey
+
+
+  def clone(self) -> 'Tile':
+    """Return a new Tile with the same pixmap, rotation and flip as this one.
+
+    The clone is not added to any scene.
+    """
+
+    tile = Tile(self.pixmap())
+    tile.setRotation(self.rotation())
+    tile.setTransform(self.transform())
+    return tile
+
+
   def rotateRight(self):
     """Rotates the tile 90 degrees to the right."""
 
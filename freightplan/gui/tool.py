@@ -27,11 +27,39 @@ Classes that subclass Tool will override the usual events in order to define
 their behavior. Events are forwarded by the Editor to the active Tool.
 """
 
-from PySide2 import QtGui, QtWidgets
 from PySide2.QtCore import QEvent, QObject
 from PySide2.QtGui import QIcon, QKeySequence
 from PySide2.QtWidgets import QAction
 
+def _buildEventHandlerTable(handlers: dict) -> tuple:
+  """Build a lookup table of event handler names indexed by event type.
+
+  Args:
+    handlers: Maps each handled QEvent.Type to the name of its handler.
+  """
+
+  table = [None] * (max(int(et) for et in handlers) + 1)
+  for et, name in handlers.items():
+    table[int(et)] = name
+  return tuple(table)
+
+
+# Names of the Tool methods that handle each type of event forwarded by the
+# Editor, indexed by event type; see Tool.event()
+_eventHandlers = _buildEventHandlerTable({
+  QEvent.GraphicsSceneMousePress: 'mousePressEvent',
+  QEvent.GraphicsSceneMouseRelease: 'mouseReleaseEvent',
+  QEvent.GraphicsSceneMouseMove: 'mouseMoveEvent',
+  QEvent.GraphicsSceneMouseDoubleClick: 'mouseDoubleClickEvent',
+  QEvent.GraphicsSceneHoverEnter: 'hoverEnterEvent',
+  QEvent.GraphicsSceneHoverLeave: 'hoverLeaveEvent',
+  QEvent.GraphicsSceneHoverMove: 'hoverMoveEvent',
+  QEvent.Enter: 'enterEvent',
+  QEvent.Leave: 'leaveEvent',
+  QEvent.KeyPress: 'keyPressEvent',
+  QEvent.KeyRelease: 'keyReleaseEvent'
+})
+
 class Tool(QObject):
   """Base class for an Editor tool.
 
@@ -39,6 +67,20 @@ class Tool(QObject):
   inspecting its contents.
   """
 
+  # _eventHandlers, limited to the handlers the class overrides. The base
+  # handlers only ignore the event, so there's no need to call them.
+  _handlers = ()
+
+  def __init_subclass__(cls, **kwargs):
+    """Determine which event handlers the subclass overrides."""
+
+    super().__init_subclass__(**kwargs)
+    cls._handlers = tuple(
+      name if name and getattr(cls, name) is not getattr(Tool, name) else None
+      for name in _eventHandlers
+    )
+
+
   def __init__(self, name: str, icon: QIcon,
                shortcut: QKeySequence=QKeySequence(), parent: QObject=None):
     """Constructor."""
@@ -51,20 +93,6 @@ class Tool(QObject):
     self.action = QAction(icon, name, parent)
     self.action.setShortcut(shortcut)
 
-    self._eventDict = {
-      QEvent.GraphicsSceneMousePress: self.mousePressEvent,
-      QEvent.GraphicsSceneMouseRelease: self.mouseReleaseEvent,
-      QEvent.GraphicsSceneMouseMove: self.mouseMoveEvent,
-      QEvent.GraphicsSceneMouseDoubleClick: self.mouseDoubleClickEvent,
-      QEvent.GraphicsSceneHoverEnter: self.hoverEnterEvent,
-      QEvent.GraphicsSceneHoverLeave: self.hoverLeaveEvent,
-      QEvent.GraphicsSceneHoverMove: self.hoverMoveEvent,
-      QEvent.Enter: self.enterEvent,
-      QEvent.Leave: self.leaveEvent,
-      QEvent.KeyPress: self.keyPressEvent,
-      QEvent.KeyRelease: self.keyReleaseEvent
-    }
-
 
   def name(self) -> str:
     """Return the name of the Tool."""
@@ -104,53 +132,31 @@ class Tool(QObject):
 
   def event(self, event: QEvent):
     if self.enabled():
-      et = event.type()
-      if et in self._eventDict:
-        self._eventDict[et](event)
+      handlers = self._handlers
+      et = int(event.type())
+      handler = handlers[et] if et < len(handlers) else None
+      if handler is not None:
+        getattr(self, handler)(event)
         if event.isAccepted():
           return True
     return False
 
 
-  def mousePressEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent):
-    event.ignore()
-
-
-  def mouseReleaseEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent):
-    event.ignore()
-
-
-  def mouseMoveEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent):
-    event.ignore()
-
-
-  def mouseDoubleClickEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent):
-    event.ignore()
-
-
-  def enterEvent(self, event: QtGui.QEnterEvent):
-    event.ignore()
-
-
-  def leaveEvent(self, event: QEvent):
-    event.ignore()
-
-
-  def hoverEnterEvent(self, event: QtWidgets.QGraphicsSceneHoverEvent):
-    event.ignore()
-
-
-  def hoverLeaveEvent(self, event: QtWidgets.QGraphicsSceneHoverEvent):
-    event.ignore()
-
+  def _ignoreEvent(self, event: QEvent):
+    """Ignore the event. Default for every event handler."""
 
-  def hoverMoveEvent(self, event: QtWidgets.QGraphicsSceneHoverEvent):
     event.ignore()
 
 
-  def keyPressEvent(self, event: QtGui.QKeyEvent):
-    event.ignore()
-
-
-  def keyReleaseEvent(self, event: QtGui.QKeyEvent):
-    event.ignore()
+  # Event handlers; override these to define the Tool's behavior
+  mousePressEvent = _ignoreEvent
+  mouseReleaseEvent = _ignoreEvent
+  mouseMoveEvent = _ignoreEvent
+  mouseDoubleClickEvent = _ignoreEvent
+  enterEvent = _ignoreEvent
+  leaveEvent = _ignoreEvent
+  hoverEnterEvent = _ignoreEvent
+  hoverLeaveEvent = _ignoreEvent
+  hoverMoveEvent = _ignoreEvent
+  keyPressEvent = _ignoreEvent
+  keyReleaseEvent = _ignoreEvent
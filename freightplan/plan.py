@@ -20,12 +20,16 @@ A plan is the typical "document" in freightplan; it represents everything
 about a given freighter layout.
 """
 
+from itertools import count
+
 from freightplan.document import Document
 from freightplan.floor import Floor
 
 class Plan(Document):
   """A freighter plan. The typical "document" in freightplan."""
 
+  __slots__ = ('_name', '_floors', '_floorsById', '_floorIds')
+
   cellSize = 32
 
   # TODO: parameters
@@ -36,7 +40,8 @@ class Plan(Document):
 
     self._name = filename
     self._floors = []
-    self._nextFloorId = 0
+    self._floorsById = {}
+    self._floorIds = count()
 
     self.addFloor(1)
 
@@ -61,6 +66,7 @@ class Plan(Document):
     floor = Floor(name, level, self, visible=True, locked=False)
     floor.setId(self.claimNextFloorId())
     self._floors.append(floor)
+    self._floorsById[floor.id()] = floor
 
 
   def removeFloor(self, index: int):
@@ -72,7 +78,7 @@ class Plan(Document):
       index: The index to the plan's floor list of the floor to remove.
     """
     if len(self._floors) > 1:
-      del self._floors[index]
+      del self._floorsById[self._floors.pop(index).id()]
     else:
       raise Exception('Cannot remove last floor')
 
@@ -83,9 +89,13 @@ class Plan(Document):
     return self._floors[index]
 
 
+  def floorById(self, id: int) -> Floor:
+    """Return the floor with the given id."""
+
+    return self._floorsById[id]
+
+
   def claimNextFloorId(self):
     """Return the next available floor id."""
 
-    nextId = self._nextFloorId
-    self._nextFloorId += 1
-    return nextId
\ No newline at end of file
+    return next(self._floorIds)
\ No newline at end of file
@@ -20,6 +20,8 @@ Manages open plans. Takes ownership of each Plan object created and
 coordinates UI state with document/file state.
 """
 
+from collections import deque
+
 from PySide2.QtCore import QObject, Signal, Slot
 from PySide2.QtWidgets import QTabWidget
 
@@ -44,9 +46,9 @@ class PlanManager(QObject):
 
     super().__init__(parent)
 
-    self.parent = parent
     self.tabPane = QTabWidget(parent)
-    self._tabHistory = [-1] * TAB_HISTORY_SIZE
+    # Bounded; appending a tab index drops the oldest entry
+    self._tabHistory = deque([-1] * TAB_HISTORY_SIZE, TAB_HISTORY_SIZE)
     self._newPlanCount = 1
 
     self.tabPane.currentChanged.connect(self.handleLastTab)
@@ -55,11 +57,8 @@ class PlanManager(QObject):
   def currentEditor(self) -> Editor:
     """Return the Editor in the active tab."""
 
-    currentIndex = self.tabPane.currentIndex()
-    if currentIndex == -1:
-      return None
-    else:
-      return self.tabPane.widget(currentIndex).editor()
+    view = self.tabPane.currentWidget()
+    return view.editor() if view is not None else None
 
 
   def viewAt(self, index) -> EditorView:
@@ -72,22 +71,19 @@ class PlanManager(QObject):
     """Return the Editor in the tab at the specified index."""
 
     view = self.viewAt(index)
-    return view.editor() if view else None
+    return view.editor() if view is not None else None
 
 
   def handleLastTab(self, index: int):
     """Maintain a short history of previously active tabs."""
 
-    self._tabHistory = [*self._tabHistory[1:], index]
+    self._tabHistory.append(index)
 
 
   def lastTab(self) -> int:
     """Return the index of the last active tab."""
 
-    try:
-      return self._tabHistory[-2]
-    except IndexError:
-      return -1
+    return self._tabHistory[-2]
 
 
   @Slot(Components.ComponentID)
@@ -97,7 +93,7 @@ class PlanManager(QObject):
     currentEditor = self.currentEditor()
     if currentEditor:
       component = Components.componentByID(cid)
-      currentEditor.setTileBrush(component.icon().pixmap(32, 32))
+      currentEditor.setTileBrush(component.pixmap())
 
 
   @Slot()